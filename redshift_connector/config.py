@@ -36,7 +36,8 @@ max_int4: int = 2 ** 31
 min_int8: int = -(2 ** 63)
 max_int8: int = 2 ** 63
 EPOCH: Datetime = Datetime(2000, 1, 1)
-EPOCH_TZ: Datetime = EPOCH.replace(tzinfo=Timezone.utc)
+UTC: Timezone = Timezone.utc
+EPOCH_TZ: Datetime = EPOCH.replace(tzinfo=UTC)
 EPOCH_SECONDS: int = timegm(EPOCH.timetuple())
 INFINITY_MICROSECONDS: int = 2 ** 63 - 1
 MINUS_INFINITY_MICROSECONDS: int = -1 * INFINITY_MICROSECONDS - 1
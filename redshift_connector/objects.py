@@ -3,38 +3,20 @@ from datetime import datetime as Datetime
 from datetime import time
 from time import localtime
 
+Date = date
+"""Alias of :class:`datetime.date`, the `DBAPI 2.0 specification
+<http://www.python.org/dev/peps/pep-0249/>`_ Date constructor.
+"""
 
-def Date(year: int, month: int, day: int) -> date:
-    """Constuct an object holding a date value.
+Time = time
+"""Alias of :class:`datetime.time`, the `DBAPI 2.0 specification
+<http://www.python.org/dev/peps/pep-0249/>`_ Time constructor.
+"""
 
-    This function is part of the `DBAPI 2.0 specification
-    <http://www.python.org/dev/peps/pep-0249/>`_.
-
-    :rtype: :class:`datetime.date`
-    """
-    return date(year, month, day)
-
-
-def Time(hour: int, minute: int, second: int) -> time:
-    """Construct an object holding a time value.
-
-    This function is part of the `DBAPI 2.0 specification
-    <http://www.python.org/dev/peps/pep-0249/>`_.
-
-    :rtype: :class:`datetime.time`
-    """
-    return time(hour, minute, second)
-
-
-def Timestamp(year: int, month: int, day: int, hour: int, minute: int, second: int) -> Datetime:
-    """Construct an object holding a timestamp value.
-
-    This function is part of the `DBAPI 2.0 specification
-    <http://www.python.org/dev/peps/pep-0249/>`_.
-
-    :rtype: :class:`datetime.datetime`
-    """
-    return Datetime(year, month, day, hour, minute, second)
+Timestamp = Datetime
+"""Alias of :class:`datetime.datetime`, the `DBAPI 2.0 specification
+<http://www.python.org/dev/peps/pep-0249/>`_ Timestamp constructor.
+"""
 
 
 def DateFromTicks(ticks: float) -> date:
@@ -46,7 +28,8 @@ def DateFromTicks(ticks: float) -> date:
 
     :rtype: :class:`datetime.date`
     """
-    return Date(*localtime(ticks)[:3])
+    t = localtime(ticks)
+    return date(t.tm_year, t.tm_mon, t.tm_mday)
 
 
 def TimeFromTicks(ticks: float) -> time:
@@ -58,7 +41,8 @@ def TimeFromTicks(ticks: float) -> time:
 
     :rtype: :class:`datetime.time`
     """
-    return Time(*localtime(ticks)[3:6])
+    t = localtime(ticks)
+    return time(t.tm_hour, t.tm_min, t.tm_sec)
 
 
 def TimestampFromTicks(ticks: float) -> Datetime:
@@ -70,7 +54,8 @@ def TimestampFromTicks(ticks: float) -> Datetime:
 
     :rtype: :class:`datetime.datetime`
     """
-    return Timestamp(*localtime(ticks)[:6])
+    t = localtime(ticks)
+    return Datetime(t.tm_year, t.tm_mon, t.tm_mday, t.tm_hour, t.tm_min, t.tm_sec)
 
 
 def Binary(value: bytes):
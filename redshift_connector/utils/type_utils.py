@@ -7,7 +7,6 @@ from datetime import date
 from datetime import datetime as Datetime
 from datetime import time
 from datetime import timedelta as Timedelta
-from datetime import timezone as Timezone
 from decimal import Decimal
 from enum import Enum
 from json import loads
@@ -19,6 +18,7 @@ from redshift_connector.config import (
     EPOCH_TZ,
     FC_BINARY,
     FC_TEXT,
+    UTC,
     _client_encoding,
     timegm,
 )
@@ -236,7 +236,7 @@ def abstime_recv(data: bytes, offset: int, length: int) -> Datetime:
     # As of Version 3.0, times are no longer read and written using Greenwich Mean Time;
     # the input and output routines default to the local time zone.
     # Ref https://www.postgresql.org/docs/6.3/c0804.htm#abstime
-    return server_date.astimezone(Timezone.utc)
+    return server_date.astimezone(UTC)
 
 
 # data is 64-bit integer representing microseconds since 2000-01-01
@@ -247,7 +247,7 @@ def timestamp_send_integer(v: Datetime) -> bytes:
 def timestamptz_send_integer(v: Datetime) -> bytes:
     # timestamps should be sent as UTC.  If they have zone info,
     # convert them.
-    return timestamp_send_integer(v.astimezone(Timezone.utc).replace(tzinfo=None))
+    return timestamp_send_integer(v.astimezone(UTC).replace(tzinfo=None))
 
 
 # return a timezone-aware datetime instance if we're reading from a
@@ -330,7 +330,7 @@ def interval_recv_integer(data: bytes, offset: int, length: int) -> typing.Union
 
 
 def timetz_recv_binary(data: bytes, offset: int, length: int) -> time:
-    return time_recv_binary(data, offset, length).replace(tzinfo=Timezone.utc)
+    return time_recv_binary(data, offset, length).replace(tzinfo=UTC)
 
 
 # data is 64-bit integer representing microseconds
@@ -376,7 +376,7 @@ def timetz_in(data: bytes, offset: int, length: int) -> time:
                     break
 
             microsec += int(data[idx_tz + 1 : end_microseconds])
-    return time(hour, minute, int(sec), microsec, tzinfo=Timezone.utc)
+    return time(hour, minute, int(sec), microsec, tzinfo=UTC)
 
 
 def date_recv_binary(data: bytes, offset: int, length: int) -> date:
@@ -1,9 +1,11 @@
 import os
 import pathlib
+import subprocess
 import typing
 from datetime import date, datetime, time, timezone
 from decimal import Decimal
 from enum import Enum, auto
+from itertools import chain
 
 if typing.TYPE_CHECKING:
     from redshift_connector import Connection
@@ -29,7 +31,7 @@ class RedshiftDatatypes(Enum):
 
     @classmethod
     def list(cls) -> typing.List["RedshiftDatatypes"]:
-        return list(map(lambda p: p, cls))  # type: ignore
+        return list(cls)
 
 
 redshift_test_data: typing.Dict[
@@ -195,7 +197,7 @@ class Datatypes(Enum):
 
     @classmethod
     def list(cls) -> typing.List["Datatypes"]:
-        return list(map(lambda p: p, cls))  # type: ignore
+        return list(cls)
 
 
 FLOAT_DATATYPES: typing.Tuple[Datatypes, ...] = (Datatypes.float4, Datatypes.float8, Datatypes.numeric)
@@ -208,8 +210,8 @@ DATATYPES_WITH_MS: typing.Tuple[Datatypes, ...] = (Datatypes.timetz, Datatypes.t
 # 3) (Optional) the Python value we expect to receive. If this field is missing,
 # we expect to receive the test value back directly.
 
-test_data: typing.Dict[str, typing.Tuple[typing.Tuple[typing.Any, ...], ...]] = {
-    Datatypes.int2.name: (  # smallint
+test_data: typing.Dict[Datatypes, typing.Tuple[typing.Tuple[typing.Any, ...], ...]] = {
+    Datatypes.int2: (  # smallint
         ("-32768", -32768),  # signed 2 byte int min
         ("-128", -128),
         ("-1", -1),
@@ -220,7 +222,7 @@ test_data: typing.Dict[str, typing.Tuple[typing.Tuple[typing.Any, ...], ...]] =
         ("127", 127),
         ("32767", 32767),  # signed 2 byte int max
     ),
-    Datatypes.int4.name: (  # integer
+    Datatypes.int4: (  # integer
         ("-2147483648", -2147483648),  # signed 4 byte int min
         ("-32768", -32768),  # signed 2 byte int min
         ("-128", -128),
@@ -233,7 +235,7 @@ test_data: typing.Dict[str, typing.Tuple[typing.Tuple[typing.Any, ...], ...]] =
         ("32767", 32767),  # signed 2 byte int max
         ("2147483647", 2147483647),  # signed 4 byte int max
     ),
-    Datatypes.int8.name: (  # bigint
+    Datatypes.int8: (  # bigint
         ("-9223372036854775808", -9223372036854775808),  # signed 8 byte int min
         ("-2147483648", -2147483648),  # signed 4 byte int min
         ("-32768", -32768),  # signed 2 byte int min
@@ -248,7 +250,7 @@ test_data: typing.Dict[str, typing.Tuple[typing.Tuple[typing.Any, ...], ...]] =
         ("2147483647", 2147483647),  # signed 4 byte int max
         ("9223372036854775807", 9223372036854775807),  # signed 8 byte int max
     ),
-    Datatypes.numeric.name: (
+    Datatypes.numeric: (
         ("-2147483648", -2147483648, Decimal(-2147483648)),  # signed 4 byte int min
         ("-32768", -32768, Decimal(-32768)),  # signed 2 byte int min
         ("-12345.67891", -12345.67891, Decimal("-12345.67891")),
@@ -267,7 +269,7 @@ test_data: typing.Dict[str, typing.Tuple[typing.Tuple[typing.Any, ...], ...]] =
         ("32767", 32767, Decimal(32767)),  # signed 2 byte int max
         ("2147483647", 2147483647, Decimal(2147483647)),  # signed 4 byte int max
     ),
-    Datatypes.float4.name: (  # real
+    Datatypes.float4: (  # real
         ("-2147483648.0001", -2147483648.0001),
         ("-2147483648", -2147483648),  # signed 4 byte int min
         ("-32768", -32768),  # signed 2 byte int min
@@ -291,7 +293,7 @@ test_data: typing.Dict[str, typing.Tuple[typing.Tuple[typing.Any, ...], ...]] =
         ("12345678.901234", 12345678.901234),
         ("2147483647", 2147483647),  # signed 4 byte int max,
     ),
-    Datatypes.float8.name: (  # double precision
+    Datatypes.float8: (  # double precision
         ("-2147483648.0001", -2147483648.0001),
         ("-2147483648", -2147483648),  # signed 4 byte int min
         ("-12345678.123456789123456", 12345678.132456789123456),
@@ -318,7 +320,7 @@ test_data: typing.Dict[str, typing.Tuple[typing.Tuple[typing.Any, ...], ...]] =
         ("12345678.901234", 12345678.901234),
         ("2147483647", 2147483647),  # signed 4 byte int max,
     ),
-    Datatypes.bool.name: (
+    Datatypes.bool: (
         ("TRUE", "TRUE", True),
         ("t", "t", True),
         ("true", "true", True),
@@ -332,13 +334,13 @@ test_data: typing.Dict[str, typing.Tuple[typing.Tuple[typing.Any, ...], ...]] =
         ("no", "no", False),
         ("0", "0", False),
     ),
-    Datatypes.char.name: tuple(
-        ("chr({})".format(i), chr(i))
-        for i in list(range(32, 39)) + list(range(40, 92)) + list(range(93, 128))
+    Datatypes.char: tuple(
+        (f"chr({i})", chr(i))
+        for i in chain(range(32, 39), range(40, 92), range(93, 128))
         # skip ' \ some control chars
         # ref: https://www.utf8-chartable.de/unicode-utf8-table.pl?utf8=dec
     ),
-    Datatypes.varchar.name: (
+    Datatypes.varchar: (
         ("empty", ""),
         ("negative one", "-1"),
         ("zero", "0"),
@@ -359,7 +361,7 @@ test_data: typing.Dict[str, typing.Tuple[typing.Tuple[typing.Any, ...], ...]] =
             "The quick brown fox jumps over the lazy dog                                                                                               ",
         ),
     ),
-    Datatypes.date.name: (
+    Datatypes.date: (
         ("julian date", "4713-01-12", date(year=4713, month=1, day=12)),
         ("mm/dd/yyy", "01-06-2020", date(year=2020, month=1, day=6)),
         ("yyyy-mm-dd", "2020-01-06", date(year=2020, month=1, day=6)),
@@ -368,14 +370,14 @@ test_data: typing.Dict[str, typing.Tuple[typing.Tuple[typing.Any, ...], ...]] =
         ("some day", "01-01-1900", date(year=1900, month=1, day=1)),
         ("feb 29 2020", "02-29-2020", date(year=2020, month=2, day=29)),
     ),
-    Datatypes.timestamp.name: (
+    Datatypes.timestamp: (
         ("julian date", "4713-01-12 00:00:00", datetime(year=4713, month=1, day=12, hour=0, minute=0, second=0)),
         ("jun 1 2008", "Jun 1,2008  09:59:59", datetime(year=2008, month=6, day=1, hour=9, minute=59, second=59)),
         ("dec 31 2008", "Dec 31,2008 18:20", datetime(year=2008, month=12, day=31, hour=18, minute=20, second=0)),
         ("feb 29, 2020", "02-29-2020 00:00:00", datetime(year=2020, month=2, day=29, hour=0, minute=0, second=0)),
         ("max date", "294276-01-02 23:59:59", datetime.max),  # too big for datetime.datetime
     ),
-    Datatypes.timestamptz.name: (
+    Datatypes.timestamptz: (
         (
             "julian date",
             "4713-01-12 00:00:00 UTC",
@@ -398,14 +400,14 @@ test_data: typing.Dict[str, typing.Tuple[typing.Tuple[typing.Any, ...], ...]] =
         ),
         ("max date", "294276-01-02 23:59:59 UTC", datetime.max),  # too big for datetime.datetime
     ),
-    Datatypes.time.name: (
+    Datatypes.time: (
         ("early", "00:00:00", time(hour=0, minute=0, second=0)),
         ("noon", "12:30:10", time(hour=12, minute=30, second=10)),
         ("evening", "18:42:22", time(hour=18, minute=42, second=22)),
         ("night", "22:44:54", time(hour=22, minute=44, second=54)),
         ("end", "24:00:00", time(hour=0, minute=0)),
     ),
-    Datatypes.timetz.name: (
+    Datatypes.timetz: (
         ("early", "00:00:00 EST", time(hour=5, minute=0, second=0, tzinfo=timezone.utc)),
         ("noon", "12:30:10 WDT", time(hour=3, minute=30, second=10, tzinfo=timezone.utc)),
         ("evening", "18:42:22 GMT", time(hour=18, minute=42, second=22, tzinfo=timezone.utc)),
@@ -426,81 +428,67 @@ def get_table_name(dt: Datatypes) -> str:
 
 
 def _make_data_str(dt: Datatypes) -> str:
-    datas: typing.List[str] = []
-
-    for row in test_data[dt.name]:
-        # if the column storing test data is a string in test_data, insert it as a string
-        test_col: str = "'{val}'".format(val=row[1]) if isinstance(row[1], str) else row[1]
-        datas.append("('{c1_val}', {c2_val})".format(c1_val=row[0], c2_val=test_col))
-
-    return ",".join(datas)
+    # if the column storing test data is a string in test_data, insert it as a string
+    return ",".join(
+        f"('{row[0]}', '{row[1]}')" if isinstance(row[1], str) else f"('{row[0]}', {row[1]})"
+        for row in test_data[dt]
+    )
 
 
-def _build_table_stmts(dt: Datatypes) -> None:
-    drop_stmt: str = "drop table if exists {schema}.test_{datatype};".format(schema=SCHEMA_NAME, datatype=dt.name)
+def _build_table_stmts(dt: Datatypes, stmts: typing.List[str]) -> None:
+    drop_stmt: str = f"drop table if exists {SCHEMA_NAME}.test_{dt.name};"
 
     col_type: str = dt.name
-    if dt.name == Datatypes.numeric.name:
+    if dt is Datatypes.numeric:
         col_type += dt.value
 
-    create_stmt: str = "create table {schema}.test_{datatype} (c1 varchar, c2 {col_type});".format(
-        schema=SCHEMA_NAME, datatype=dt.name, col_type=col_type
-    )
-    insert_stmt: str = "insert into {schema}.test_{datatype}(c1, c2) values{data};".format(
-        schema=SCHEMA_NAME, datatype=dt.name, data=_make_data_str(dt)
-    )
+    create_stmt: str = f"create table {SCHEMA_NAME}.test_{dt.name} (c1 varchar, c2 {col_type});"
+    insert_stmt: str = f"insert into {SCHEMA_NAME}.test_{dt.name}(c1, c2) values{_make_data_str(dt)};"
 
-    with open(CREATE_FILE_PATH, "a") as f:
-        f.write(drop_stmt + "\n")
-        f.write(create_stmt + "\n")
-        f.write(insert_stmt + "\n")
+    stmts.append(drop_stmt + "\n" + create_stmt + "\n" + insert_stmt + "\n")
 
 
-def _build_schema_stmts() -> None:
+def _build_schema_stmts(stmts: typing.List[str]) -> None:
     drop_stmt: str = "drop schema if exists {name} cascade;".format(name=SCHEMA_NAME)
     create_stmt: str = "create schema {name};".format(name=SCHEMA_NAME)
 
-    with open(CREATE_FILE_PATH, "a+") as f:
-        f.write(drop_stmt + "\n")
-        f.write(create_stmt + "\n")
+    stmts.append(drop_stmt + "\n" + create_stmt + "\n")
+
+
+def _run_psql(conf, file_path: str) -> None:
+    subprocess.run(
+        [
+            "psql",
+            "--host",
+            conf.get("ci-cluster", "host"),
+            "--port",
+            "5439",
+            "--user",
+            conf.get("ci-cluster", "test_user"),
+            "--dbname",
+            conf.get("ci-cluster", "database"),
+            "-f",
+            file_path,
+        ],
+        env={**os.environ, "PGPASSWORD": conf.get("ci-cluster", "test_password")},
+        check=True,
+    )
 
 
 def datatype_test_setup(conf) -> None:
-    try:  # remove test sql file if exists
-        os.remove(CREATE_FILE_PATH)
-    except OSError:
-        pass
-
     # build test sql file
-    _build_schema_stmts()
+    stmts: typing.List[str] = []
+    _build_schema_stmts(stmts)
     for dt in Datatypes:
-        _build_table_stmts(dt)
+        _build_table_stmts(dt, stmts)
+    with open(CREATE_FILE_PATH, "w") as f:
+        f.write("".join(stmts))
     # execute test sql file
-    os.system(
-        "PGPASSWORD={password} psql --host={host} --port 5439 --user={user} --dbname={db} -f {file}".format(
-            password=conf.get("ci-cluster", "test_password"),
-            host=conf.get("ci-cluster", "host"),
-            user=conf.get("ci-cluster", "test_user"),
-            db=conf.get("ci-cluster", "database"),
-            file=CREATE_FILE_PATH,
-        )
-    )
+    _run_psql(conf, CREATE_FILE_PATH)
 
 
 def datatype_test_teardown(conf) -> None:
-    try:  # remove test sql file if exists
-        os.remove(TEARDOWN_FILE_PATH)
-    except OSError:
-        pass
-    with open(TEARDOWN_FILE_PATH, "a+") as f:
+    with open(TEARDOWN_FILE_PATH, "w") as f:
         f.write("drop schema if exists {name} cascade;".format(name=SCHEMA_NAME))
 
-    os.system(
-        "PGPASSWORD={password} psql --host={host} --port 5439 --user={user} --dbname={db} -f {file}".format(
-            password=conf.get("ci-cluster", "test_password"),
-            host=conf.get("ci-cluster", "host"),
-            user=conf.get("ci-cluster", "test_user"),
-            db=conf.get("ci-cluster", "database"),
-            file=TEARDOWN_FILE_PATH,
-        )
-    )
+    _run_psql(conf, TEARDOWN_FILE_PATH)
@@ -40,7 +40,7 @@ class PerformanceTestDatatypes(Enum):
 
     @classmethod
     def list(cls) -> typing.List["PerformanceTestDatatypes"]:
-        return list(map(lambda p: p, cls))  # type: ignore
+        return list(cls)
 
 
 PROTOCOLS: typing.Tuple[ClientProtocolVersion, ...] = (
@@ -1,3 +1,4 @@
+import datetime
 import time
 
 import redshift_connector
@@ -62,6 +63,21 @@ def test_Timestamp():
     driver.TimestampFromTicks(time.mktime((2002, 12, 25, 13, 45, 30, 0, 0, 0)))
 
 
+def test_date_time_constructors_are_stdlib_types():
+    assert driver.Date is datetime.date
+    assert driver.Time is datetime.time
+    assert driver.Timestamp is datetime.datetime
+    assert driver.Date(2002, 12, 25) == datetime.date(2002, 12, 25)
+    assert driver.Timestamp(2002, 12, 25, 13, 45, 30) == datetime.datetime(2002, 12, 25, 13, 45, 30)
+
+
+def test_from_ticks_constructors():
+    ticks: float = time.mktime((2002, 12, 25, 13, 45, 30, 0, 0, -1))
+    assert driver.DateFromTicks(ticks) == datetime.date(2002, 12, 25)
+    assert driver.TimeFromTicks(ticks) == datetime.time(13, 45, 30)
+    assert driver.TimestampFromTicks(ticks) == datetime.datetime(2002, 12, 25, 13, 45, 30)
+
+
 def test_Binary():
     driver.Binary(b"Something")
     driver.Binary(b"")